@@ -4,22 +4,43 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, ClassVar, Optional
+
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
 
 
 class AST:
-    __match_args__ = ()
-    _fields = ()
+    __slots__ = ("__weakref__",)
+    __match_args__ = _fields = ()
+
+    def __repr__(self) -> str:
+        # One implementation for every node, driven by the class's fields.
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+class _Singleton(AST):
+    __slots__ = ()
+
+    _instance: ClassVar[Optional[_Singleton]]
+
+    def __new__(cls) -> Self:
+        # Instances have no state, so they can all be the same object. Look the instance up in the class's
+        # own namespace so that subclasses don't share their parent's instance.
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = cls._instance = super().__new__(cls)
+        return instance
 
 
 class mod(AST):
-    __match_args__ = ()
-    _fields = ()
+    __slots__ = ()
 
 
 class Module(mod):
-    __match_args__ = ('body', 'type_ignores')
-    _fields = ('body', 'type_ignores')
+    __slots__ = __match_args__ = _fields = ('body', 'type_ignores')
 
     def __init__(self, body: list[stmt], type_ignores: list[type_ignore]) -> None:
         self.body = body
@@ -27,24 +48,21 @@ class Module(mod):
 
 
 class Interactive(mod):
-    __match_args__ = ('body')
-    _fields = ('body')
+    __slots__ = __match_args__ = _fields = ('body',)
 
     def __init__(self, body: list[stmt]) -> None:
         self.body = body
 
 
 class Expression(mod):
-    __match_args__ = ('body')
-    _fields = ('body')
+    __slots__ = __match_args__ = _fields = ('body',)
 
     def __init__(self, body: expr) -> None:
         self.body = body
 
 
 class FunctionType(mod):
-    __match_args__ = ('argtypes', 'returns')
-    _fields = ('argtypes', 'returns')
+    __slots__ = __match_args__ = _fields = ('argtypes', 'returns')
 
     def __init__(self, argtypes: list[expr], returns: expr) -> None:
         self.argtypes = argtypes
@@ -52,19 +70,11 @@ class FunctionType(mod):
 
 
 class stmt(AST):
-    __match_args__ = ()
-    _fields = ()
-
-    def __init__(self, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
-        self.lineno = lineno
-        self.col_offset = col_offset
-        self.end_lineno = end_lineno
-        self.end_col_offset = end_col_offset
+    __slots__ = ('lineno', 'col_offset', 'end_lineno', 'end_col_offset')
 
 
 class FunctionDef(stmt):
-    __match_args__ = ('name', 'args', 'body', 'decorator_list', 'returns', 'type_comment', 'type_params')
-    _fields = ('name', 'args', 'body', 'decorator_list', 'returns', 'type_comment', 'type_params')
+    __slots__ = __match_args__ = _fields = ('name', 'args', 'body', 'decorator_list', 'returns', 'type_comment', 'type_params')
 
     def __init__(self, name: str, args: arguments, body: list[stmt], decorator_list: list[expr], returns: Optional[expr], type_comment: Optional[str], type_params: list[type_param], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.name = name
@@ -81,8 +91,7 @@ class FunctionDef(stmt):
 
 
 class AsyncFunctionDef(stmt):
-    __match_args__ = ('name', 'args', 'body', 'decorator_list', 'returns', 'type_comment', 'type_params')
-    _fields = ('name', 'args', 'body', 'decorator_list', 'returns', 'type_comment', 'type_params')
+    __slots__ = __match_args__ = _fields = ('name', 'args', 'body', 'decorator_list', 'returns', 'type_comment', 'type_params')
 
     def __init__(self, name: str, args: arguments, body: list[stmt], decorator_list: list[expr], returns: Optional[expr], type_comment: Optional[str], type_params: list[type_param], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.name = name
@@ -99,8 +108,7 @@ class AsyncFunctionDef(stmt):
 
 
 class ClassDef(stmt):
-    __match_args__ = ('name', 'bases', 'keywords', 'body', 'decorator_list', 'type_params')
-    _fields = ('name', 'bases', 'keywords', 'body', 'decorator_list', 'type_params')
+    __slots__ = __match_args__ = _fields = ('name', 'bases', 'keywords', 'body', 'decorator_list', 'type_params')
 
     def __init__(self, name: str, bases: list[expr], keywords: list[keyword], body: list[stmt], decorator_list: list[expr], type_params: list[type_param], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.name = name
@@ -116,8 +124,7 @@ class ClassDef(stmt):
 
 
 class Return(stmt):
-    __match_args__ = ('value')
-    _fields = ('value')
+    __slots__ = __match_args__ = _fields = ('value',)
 
     def __init__(self, value: Optional[expr], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.value = value
@@ -128,8 +135,7 @@ class Return(stmt):
 
 
 class Delete(stmt):
-    __match_args__ = ('targets')
-    _fields = ('targets')
+    __slots__ = __match_args__ = _fields = ('targets',)
 
     def __init__(self, targets: list[expr], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.targets = targets
@@ -140,8 +146,7 @@ class Delete(stmt):
 
 
 class Assign(stmt):
-    __match_args__ = ('targets', 'value', 'type_comment')
-    _fields = ('targets', 'value', 'type_comment')
+    __slots__ = __match_args__ = _fields = ('targets', 'value', 'type_comment')
 
     def __init__(self, targets: list[expr], value: expr, type_comment: Optional[str], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.targets = targets
@@ -154,8 +159,7 @@ class Assign(stmt):
 
 
 class TypeAlias(stmt):
-    __match_args__ = ('name', 'type_params', 'value')
-    _fields = ('name', 'type_params', 'value')
+    __slots__ = __match_args__ = _fields = ('name', 'type_params', 'value')
 
     def __init__(self, name: expr, type_params: list[type_param], value: expr, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.name = name
@@ -168,8 +172,7 @@ class TypeAlias(stmt):
 
 
 class AugAssign(stmt):
-    __match_args__ = ('target', 'op', 'value')
-    _fields = ('target', 'op', 'value')
+    __slots__ = __match_args__ = _fields = ('target', 'op', 'value')
 
     def __init__(self, target: expr, op: operator, value: expr, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.target = target
@@ -182,8 +185,7 @@ class AugAssign(stmt):
 
 
 class AnnAssign(stmt):
-    __match_args__ = ('target', 'annotation', 'value', 'simple')
-    _fields = ('target', 'annotation', 'value', 'simple')
+    __slots__ = __match_args__ = _fields = ('target', 'annotation', 'value', 'simple')
 
     def __init__(self, target: expr, annotation: expr, value: Optional[expr], simple: int, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.target = target
@@ -197,8 +199,7 @@ class AnnAssign(stmt):
 
 
 class For(stmt):
-    __match_args__ = ('target', 'iter', 'body', 'orelse', 'type_comment')
-    _fields = ('target', 'iter', 'body', 'orelse', 'type_comment')
+    __slots__ = __match_args__ = _fields = ('target', 'iter', 'body', 'orelse', 'type_comment')
 
     def __init__(self, target: expr, iter: expr, body: list[stmt], orelse: list[stmt], type_comment: Optional[str], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.target = target
@@ -213,8 +214,7 @@ class For(stmt):
 
 
 class AsyncFor(stmt):
-    __match_args__ = ('target', 'iter', 'body', 'orelse', 'type_comment')
-    _fields = ('target', 'iter', 'body', 'orelse', 'type_comment')
+    __slots__ = __match_args__ = _fields = ('target', 'iter', 'body', 'orelse', 'type_comment')
 
     def __init__(self, target: expr, iter: expr, body: list[stmt], orelse: list[stmt], type_comment: Optional[str], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.target = target
@@ -229,8 +229,7 @@ class AsyncFor(stmt):
 
 
 class While(stmt):
-    __match_args__ = ('test', 'body', 'orelse')
-    _fields = ('test', 'body', 'orelse')
+    __slots__ = __match_args__ = _fields = ('test', 'body', 'orelse')
 
     def __init__(self, test: expr, body: list[stmt], orelse: list[stmt], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.test = test
@@ -243,8 +242,7 @@ class While(stmt):
 
 
 class If(stmt):
-    __match_args__ = ('test', 'body', 'orelse')
-    _fields = ('test', 'body', 'orelse')
+    __slots__ = __match_args__ = _fields = ('test', 'body', 'orelse')
 
     def __init__(self, test: expr, body: list[stmt], orelse: list[stmt], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.test = test
@@ -257,8 +255,7 @@ class If(stmt):
 
 
 class With(stmt):
-    __match_args__ = ('items', 'body', 'type_comment')
-    _fields = ('items', 'body', 'type_comment')
+    __slots__ = __match_args__ = _fields = ('items', 'body', 'type_comment')
 
     def __init__(self, items: list[withitem], body: list[stmt], type_comment: Optional[str], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.items = items
@@ -271,8 +268,7 @@ class With(stmt):
 
 
 class AsyncWith(stmt):
-    __match_args__ = ('items', 'body', 'type_comment')
-    _fields = ('items', 'body', 'type_comment')
+    __slots__ = __match_args__ = _fields = ('items', 'body', 'type_comment')
 
     def __init__(self, items: list[withitem], body: list[stmt], type_comment: Optional[str], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.items = items
@@ -285,8 +281,7 @@ class AsyncWith(stmt):
 
 
 class Match(stmt):
-    __match_args__ = ('subject', 'cases')
-    _fields = ('subject', 'cases')
+    __slots__ = __match_args__ = _fields = ('subject', 'cases')
 
     def __init__(self, subject: expr, cases: list[match_case], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.subject = subject
@@ -298,8 +293,7 @@ class Match(stmt):
 
 
 class Raise(stmt):
-    __match_args__ = ('exc', 'cause')
-    _fields = ('exc', 'cause')
+    __slots__ = __match_args__ = _fields = ('exc', 'cause')
 
     def __init__(self, exc: Optional[expr], cause: Optional[expr], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.exc = exc
@@ -311,8 +305,7 @@ class Raise(stmt):
 
 
 class Try(stmt):
-    __match_args__ = ('body', 'handlers', 'orelse', 'finalbody')
-    _fields = ('body', 'handlers', 'orelse', 'finalbody')
+    __slots__ = __match_args__ = _fields = ('body', 'handlers', 'orelse', 'finalbody')
 
     def __init__(self, body: list[stmt], handlers: list[excepthandler], orelse: list[stmt], finalbody: list[stmt], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.body = body
@@ -326,8 +319,7 @@ class Try(stmt):
 
 
 class TryStar(stmt):
-    __match_args__ = ('body', 'handlers', 'orelse', 'finalbody')
-    _fields = ('body', 'handlers', 'orelse', 'finalbody')
+    __slots__ = __match_args__ = _fields = ('body', 'handlers', 'orelse', 'finalbody')
 
     def __init__(self, body: list[stmt], handlers: list[excepthandler], orelse: list[stmt], finalbody: list[stmt], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.body = body
@@ -341,8 +333,7 @@ class TryStar(stmt):
 
 
 class Assert(stmt):
-    __match_args__ = ('test', 'msg')
-    _fields = ('test', 'msg')
+    __slots__ = __match_args__ = _fields = ('test', 'msg')
 
     def __init__(self, test: expr, msg: Optional[expr], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.test = test
@@ -354,8 +345,7 @@ class Assert(stmt):
 
 
 class Import(stmt):
-    __match_args__ = ('names')
-    _fields = ('names')
+    __slots__ = __match_args__ = _fields = ('names',)
 
     def __init__(self, names: list[alias], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.names = names
@@ -366,8 +356,7 @@ class Import(stmt):
 
 
 class ImportFrom(stmt):
-    __match_args__ = ('module', 'names', 'level')
-    _fields = ('module', 'names', 'level')
+    __slots__ = __match_args__ = _fields = ('module', 'names', 'level')
 
     def __init__(self, module: Optional[str], names: list[alias], level: Optional[int], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.module = module
@@ -380,8 +369,7 @@ class ImportFrom(stmt):
 
 
 class Global(stmt):
-    __match_args__ = ('names')
-    _fields = ('names')
+    __slots__ = __match_args__ = _fields = ('names',)
 
     def __init__(self, names: list[str], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.names = names
@@ -392,8 +380,7 @@ class Global(stmt):
 
 
 class Nonlocal(stmt):
-    __match_args__ = ('names')
-    _fields = ('names')
+    __slots__ = __match_args__ = _fields = ('names',)
 
     def __init__(self, names: list[str], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.names = names
@@ -404,8 +391,7 @@ class Nonlocal(stmt):
 
 
 class Expr(stmt):
-    __match_args__ = ('value')
-    _fields = ('value')
+    __slots__ = __match_args__ = _fields = ('value',)
 
     def __init__(self, value: expr, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.value = value
@@ -416,8 +402,7 @@ class Expr(stmt):
 
 
 class Pass(stmt):
-    __match_args__ = ()
-    _fields = ()
+    __slots__ = ()
 
     def __init__(self, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.lineno = lineno
@@ -427,8 +412,7 @@ class Pass(stmt):
 
 
 class Break(stmt):
-    __match_args__ = ()
-    _fields = ()
+    __slots__ = ()
 
     def __init__(self, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.lineno = lineno
@@ -438,8 +422,7 @@ class Break(stmt):
 
 
 class Continue(stmt):
-    __match_args__ = ()
-    _fields = ()
+    __slots__ = ()
 
     def __init__(self, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.lineno = lineno
@@ -449,19 +432,11 @@ class Continue(stmt):
 
 
 class expr(AST):
-    __match_args__ = ()
-    _fields = ()
-
-    def __init__(self, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
-        self.lineno = lineno
-        self.col_offset = col_offset
-        self.end_lineno = end_lineno
-        self.end_col_offset = end_col_offset
+    __slots__ = ('lineno', 'col_offset', 'end_lineno', 'end_col_offset')
 
 
 class BoolOp(expr):
-    __match_args__ = ('op', 'values')
-    _fields = ('op', 'values')
+    __slots__ = __match_args__ = _fields = ('op', 'values')
 
     def __init__(self, op: boolop, values: list[expr], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.op = op
@@ -473,8 +448,7 @@ class BoolOp(expr):
 
 
 class NamedExpr(expr):
-    __match_args__ = ('target', 'value')
-    _fields = ('target', 'value')
+    __slots__ = __match_args__ = _fields = ('target', 'value')
 
     def __init__(self, target: expr, value: expr, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.target = target
@@ -486,8 +460,7 @@ class NamedExpr(expr):
 
 
 class BinOp(expr):
-    __match_args__ = ('left', 'op', 'right')
-    _fields = ('left', 'op', 'right')
+    __slots__ = __match_args__ = _fields = ('left', 'op', 'right')
 
     def __init__(self, left: expr, op: operator, right: expr, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.left = left
@@ -500,8 +473,7 @@ class BinOp(expr):
 
 
 class UnaryOp(expr):
-    __match_args__ = ('op', 'operand')
-    _fields = ('op', 'operand')
+    __slots__ = __match_args__ = _fields = ('op', 'operand')
 
     def __init__(self, op: unaryop, operand: expr, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.op = op
@@ -513,8 +485,7 @@ class UnaryOp(expr):
 
 
 class Lambda(expr):
-    __match_args__ = ('args', 'body')
-    _fields = ('args', 'body')
+    __slots__ = __match_args__ = _fields = ('args', 'body')
 
     def __init__(self, args: arguments, body: expr, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.args = args
@@ -526,8 +497,7 @@ class Lambda(expr):
 
 
 class IfExp(expr):
-    __match_args__ = ('test', 'body', 'orelse')
-    _fields = ('test', 'body', 'orelse')
+    __slots__ = __match_args__ = _fields = ('test', 'body', 'orelse')
 
     def __init__(self, test: expr, body: expr, orelse: expr, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.test = test
@@ -540,8 +510,7 @@ class IfExp(expr):
 
 
 class Dict(expr):
-    __match_args__ = ('keys', 'values')
-    _fields = ('keys', 'values')
+    __slots__ = __match_args__ = _fields = ('keys', 'values')
 
     def __init__(self, keys: list[expr], values: list[expr], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.keys = keys
@@ -553,8 +522,7 @@ class Dict(expr):
 
 
 class Set(expr):
-    __match_args__ = ('elts')
-    _fields = ('elts')
+    __slots__ = __match_args__ = _fields = ('elts',)
 
     def __init__(self, elts: list[expr], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.elts = elts
@@ -565,8 +533,7 @@ class Set(expr):
 
 
 class ListComp(expr):
-    __match_args__ = ('elt', 'generators')
-    _fields = ('elt', 'generators')
+    __slots__ = __match_args__ = _fields = ('elt', 'generators')
 
     def __init__(self, elt: expr, generators: list[comprehension], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.elt = elt
@@ -578,8 +545,7 @@ class ListComp(expr):
 
 
 class SetComp(expr):
-    __match_args__ = ('elt', 'generators')
-    _fields = ('elt', 'generators')
+    __slots__ = __match_args__ = _fields = ('elt', 'generators')
 
     def __init__(self, elt: expr, generators: list[comprehension], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.elt = elt
@@ -591,8 +557,7 @@ class SetComp(expr):
 
 
 class DictComp(expr):
-    __match_args__ = ('key', 'value', 'generators')
-    _fields = ('key', 'value', 'generators')
+    __slots__ = __match_args__ = _fields = ('key', 'value', 'generators')
 
     def __init__(self, key: expr, value: expr, generators: list[comprehension], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.key = key
@@ -605,8 +570,7 @@ class DictComp(expr):
 
 
 class GeneratorExp(expr):
-    __match_args__ = ('elt', 'generators')
-    _fields = ('elt', 'generators')
+    __slots__ = __match_args__ = _fields = ('elt', 'generators')
 
     def __init__(self, elt: expr, generators: list[comprehension], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.elt = elt
@@ -618,8 +582,7 @@ class GeneratorExp(expr):
 
 
 class Await(expr):
-    __match_args__ = ('value')
-    _fields = ('value')
+    __slots__ = __match_args__ = _fields = ('value',)
 
     def __init__(self, value: expr, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.value = value
@@ -630,8 +593,7 @@ class Await(expr):
 
 
 class Yield(expr):
-    __match_args__ = ('value')
-    _fields = ('value')
+    __slots__ = __match_args__ = _fields = ('value',)
 
     def __init__(self, value: Optional[expr], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.value = value
@@ -642,8 +604,7 @@ class Yield(expr):
 
 
 class YieldFrom(expr):
-    __match_args__ = ('value')
-    _fields = ('value')
+    __slots__ = __match_args__ = _fields = ('value',)
 
     def __init__(self, value: expr, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.value = value
@@ -654,8 +615,7 @@ class YieldFrom(expr):
 
 
 class Compare(expr):
-    __match_args__ = ('left', 'ops', 'comparators')
-    _fields = ('left', 'ops', 'comparators')
+    __slots__ = __match_args__ = _fields = ('left', 'ops', 'comparators')
 
     def __init__(self, left: expr, ops: list[cmpop], comparators: list[expr], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.left = left
@@ -668,8 +628,7 @@ class Compare(expr):
 
 
 class Call(expr):
-    __match_args__ = ('func', 'args', 'keywords')
-    _fields = ('func', 'args', 'keywords')
+    __slots__ = __match_args__ = _fields = ('func', 'args', 'keywords')
 
     def __init__(self, func: expr, args: list[expr], keywords: list[keyword], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.func = func
@@ -682,8 +641,7 @@ class Call(expr):
 
 
 class FormattedValue(expr):
-    __match_args__ = ('value', 'conversion', 'format_spec')
-    _fields = ('value', 'conversion', 'format_spec')
+    __slots__ = __match_args__ = _fields = ('value', 'conversion', 'format_spec')
 
     def __init__(self, value: expr, conversion: int, format_spec: Optional[expr], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.value = value
@@ -696,8 +654,7 @@ class FormattedValue(expr):
 
 
 class JoinedStr(expr):
-    __match_args__ = ('values')
-    _fields = ('values')
+    __slots__ = __match_args__ = _fields = ('values',)
 
     def __init__(self, values: list[expr], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.values = values
@@ -708,8 +665,7 @@ class JoinedStr(expr):
 
 
 class Constant(expr):
-    __match_args__ = ('value', 'kind')
-    _fields = ('value', 'kind')
+    __slots__ = __match_args__ = _fields = ('value', 'kind')
 
     def __init__(self, value: object, kind: Optional[str], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.value = value
@@ -721,8 +677,7 @@ class Constant(expr):
 
 
 class Attribute(expr):
-    __match_args__ = ('value', 'attr', 'ctx')
-    _fields = ('value', 'attr', 'ctx')
+    __slots__ = __match_args__ = _fields = ('value', 'attr', 'ctx')
 
     def __init__(self, value: expr, attr: str, ctx: expr_context, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.value = value
@@ -735,8 +690,7 @@ class Attribute(expr):
 
 
 class Subscript(expr):
-    __match_args__ = ('value', 'slice', 'ctx')
-    _fields = ('value', 'slice', 'ctx')
+    __slots__ = __match_args__ = _fields = ('value', 'slice', 'ctx')
 
     def __init__(self, value: expr, slice: expr, ctx: expr_context, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.value = value
@@ -749,8 +703,7 @@ class Subscript(expr):
 
 
 class Starred(expr):
-    __match_args__ = ('value', 'ctx')
-    _fields = ('value', 'ctx')
+    __slots__ = __match_args__ = _fields = ('value', 'ctx')
 
     def __init__(self, value: expr, ctx: expr_context, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.value = value
@@ -762,8 +715,7 @@ class Starred(expr):
 
 
 class Name(expr):
-    __match_args__ = ('id', 'ctx')
-    _fields = ('id', 'ctx')
+    __slots__ = __match_args__ = _fields = ('id', 'ctx')
 
     def __init__(self, id: str, ctx: expr_context, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.id = id
@@ -775,8 +727,7 @@ class Name(expr):
 
 
 class List(expr):
-    __match_args__ = ('elts', 'ctx')
-    _fields = ('elts', 'ctx')
+    __slots__ = __match_args__ = _fields = ('elts', 'ctx')
 
     def __init__(self, elts: list[expr], ctx: expr_context, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.elts = elts
@@ -788,8 +739,7 @@ class List(expr):
 
 
 class Tuple(expr):
-    __match_args__ = ('elts', 'ctx')
-    _fields = ('elts', 'ctx')
+    __slots__ = __match_args__ = _fields = ('elts', 'ctx')
 
     def __init__(self, elts: list[expr], ctx: expr_context, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.elts = elts
@@ -801,8 +751,7 @@ class Tuple(expr):
 
 
 class Slice(expr):
-    __match_args__ = ('lower', 'upper', 'step')
-    _fields = ('lower', 'upper', 'step')
+    __slots__ = __match_args__ = _fields = ('lower', 'upper', 'step')
 
     def __init__(self, lower: Optional[expr], upper: Optional[expr], step: Optional[expr], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.lower = lower
@@ -815,193 +764,155 @@ class Slice(expr):
 
 
 class expr_context(AST):
-    __match_args__ = ()
-    _fields = ()
+    __slots__ = ()
 
 
-class Load(expr_context):
-    __match_args__ = ()
-    _fields = ()
+class Load(expr_context, _Singleton):
+    __slots__ = ()
 
 
-class Store(expr_context):
-    __match_args__ = ()
-    _fields = ()
+class Store(expr_context, _Singleton):
+    __slots__ = ()
 
 
-class Del(expr_context):
-    __match_args__ = ()
-    _fields = ()
+class Del(expr_context, _Singleton):
+    __slots__ = ()
 
 
 class boolop(AST):
-    __match_args__ = ()
-    _fields = ()
+    __slots__ = ()
 
 
-class And(boolop):
-    __match_args__ = ()
-    _fields = ()
+class And(boolop, _Singleton):
+    __slots__ = ()
 
 
-class Or(boolop):
-    __match_args__ = ()
-    _fields = ()
+class Or(boolop, _Singleton):
+    __slots__ = ()
 
 
 class operator(AST):
-    __match_args__ = ()
-    _fields = ()
+    __slots__ = ()
 
 
-class Add(operator):
-    __match_args__ = ()
-    _fields = ()
+class Add(operator, _Singleton):
+    __slots__ = ()
 
 
-class Sub(operator):
-    __match_args__ = ()
-    _fields = ()
+class Sub(operator, _Singleton):
+    __slots__ = ()
 
 
-class Mult(operator):
-    __match_args__ = ()
-    _fields = ()
+class Mult(operator, _Singleton):
+    __slots__ = ()
 
 
-class MatMult(operator):
-    __match_args__ = ()
-    _fields = ()
+class MatMult(operator, _Singleton):
+    __slots__ = ()
 
 
-class Div(operator):
-    __match_args__ = ()
-    _fields = ()
+class Div(operator, _Singleton):
+    __slots__ = ()
 
 
-class Mod(operator):
-    __match_args__ = ()
-    _fields = ()
+class Mod(operator, _Singleton):
+    __slots__ = ()
 
 
-class Pow(operator):
-    __match_args__ = ()
-    _fields = ()
+class Pow(operator, _Singleton):
+    __slots__ = ()
 
 
-class LShift(operator):
-    __match_args__ = ()
-    _fields = ()
+class LShift(operator, _Singleton):
+    __slots__ = ()
 
 
-class RShift(operator):
-    __match_args__ = ()
-    _fields = ()
+class RShift(operator, _Singleton):
+    __slots__ = ()
 
 
-class BitOr(operator):
-    __match_args__ = ()
-    _fields = ()
+class BitOr(operator, _Singleton):
+    __slots__ = ()
 
 
-class BitXor(operator):
-    __match_args__ = ()
-    _fields = ()
+class BitXor(operator, _Singleton):
+    __slots__ = ()
 
 
-class BitAnd(operator):
-    __match_args__ = ()
-    _fields = ()
+class BitAnd(operator, _Singleton):
+    __slots__ = ()
 
 
-class FloorDiv(operator):
-    __match_args__ = ()
-    _fields = ()
+class FloorDiv(operator, _Singleton):
+    __slots__ = ()
 
 
 class unaryop(AST):
-    __match_args__ = ()
-    _fields = ()
+    __slots__ = ()
 
 
-class Invert(unaryop):
-    __match_args__ = ()
-    _fields = ()
+class Invert(unaryop, _Singleton):
+    __slots__ = ()
 
 
-class Not(unaryop):
-    __match_args__ = ()
-    _fields = ()
+class Not(unaryop, _Singleton):
+    __slots__ = ()
 
 
-class UAdd(unaryop):
-    __match_args__ = ()
-    _fields = ()
+class UAdd(unaryop, _Singleton):
+    __slots__ = ()
 
 
-class USub(unaryop):
-    __match_args__ = ()
-    _fields = ()
+class USub(unaryop, _Singleton):
+    __slots__ = ()
 
 
 class cmpop(AST):
-    __match_args__ = ()
-    _fields = ()
+    __slots__ = ()
 
 
-class Eq(cmpop):
-    __match_args__ = ()
-    _fields = ()
+class Eq(cmpop, _Singleton):
+    __slots__ = ()
 
 
-class NotEq(cmpop):
-    __match_args__ = ()
-    _fields = ()
+class NotEq(cmpop, _Singleton):
+    __slots__ = ()
 
 
-class Lt(cmpop):
-    __match_args__ = ()
-    _fields = ()
+class Lt(cmpop, _Singleton):
+    __slots__ = ()
 
 
-class LtE(cmpop):
-    __match_args__ = ()
-    _fields = ()
+class LtE(cmpop, _Singleton):
+    __slots__ = ()
 
 
-class Gt(cmpop):
-    __match_args__ = ()
-    _fields = ()
+class Gt(cmpop, _Singleton):
+    __slots__ = ()
 
 
-class GtE(cmpop):
-    __match_args__ = ()
-    _fields = ()
+class GtE(cmpop, _Singleton):
+    __slots__ = ()
 
 
-class Is(cmpop):
-    __match_args__ = ()
-    _fields = ()
+class Is(cmpop, _Singleton):
+    __slots__ = ()
 
 
-class IsNot(cmpop):
-    __match_args__ = ()
-    _fields = ()
+class IsNot(cmpop, _Singleton):
+    __slots__ = ()
 
 
-class In(cmpop):
-    __match_args__ = ()
-    _fields = ()
+class In(cmpop, _Singleton):
+    __slots__ = ()
 
 
-class NotIn(cmpop):
-    __match_args__ = ()
-    _fields = ()
+class NotIn(cmpop, _Singleton):
+    __slots__ = ()
 
 
 class comprehension(AST):
-    __match_args__ = ('target', 'iter', 'ifs', 'is_async')
-    _fields = ('target', 'iter', 'ifs', 'is_async')
+    __slots__ = __match_args__ = _fields = ('target', 'iter', 'ifs', 'is_async')
 
     def __init__(self, target: expr, iter: expr, ifs: list[expr], is_async: int) -> None:
         self.target = target
@@ -1011,19 +922,11 @@ class comprehension(AST):
 
 
 class excepthandler(AST):
-    __match_args__ = ()
-    _fields = ()
-
-    def __init__(self, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
-        self.lineno = lineno
-        self.col_offset = col_offset
-        self.end_lineno = end_lineno
-        self.end_col_offset = end_col_offset
+    __slots__ = ('lineno', 'col_offset', 'end_lineno', 'end_col_offset')
 
 
 class ExceptHandler(excepthandler):
-    __match_args__ = ('type', 'name', 'body')
-    _fields = ('type', 'name', 'body')
+    __slots__ = __match_args__ = _fields = ('type', 'name', 'body')
 
     def __init__(self, type: Optional[expr], name: Optional[str], body: list[stmt], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.type = type
@@ -1036,8 +939,7 @@ class ExceptHandler(excepthandler):
 
 
 class arguments(AST):
-    __match_args__ = ('posonlyargs', 'args', 'vararg', 'kwonlyargs', 'kw_defaults', 'kwarg', 'defaults')
-    _fields = ('posonlyargs', 'args', 'vararg', 'kwonlyargs', 'kw_defaults', 'kwarg', 'defaults')
+    __slots__ = __match_args__ = _fields = ('posonlyargs', 'args', 'vararg', 'kwonlyargs', 'kw_defaults', 'kwarg', 'defaults')
 
     def __init__(self, posonlyargs: list[arg], args: list[arg], vararg: Optional[arg], kwonlyargs: list[arg], kw_defaults: list[expr], kwarg: Optional[arg], defaults: list[expr]) -> None:
         self.posonlyargs = posonlyargs
@@ -1050,8 +952,8 @@ class arguments(AST):
 
 
 class arg(AST):
-    __match_args__ = ('arg', 'annotation', 'type_comment')
-    _fields = ('arg', 'annotation', 'type_comment')
+    __slots__ = ('arg', 'annotation', 'type_comment', 'lineno', 'col_offset', 'end_lineno', 'end_col_offset')
+    __match_args__ = _fields = ('arg', 'annotation', 'type_comment')
 
     def __init__(self, arg: str, annotation: Optional[expr], type_comment: Optional[str], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.arg = arg
@@ -1064,8 +966,8 @@ class arg(AST):
 
 
 class keyword(AST):
-    __match_args__ = ('arg', 'value')
-    _fields = ('arg', 'value')
+    __slots__ = ('arg', 'value', 'lineno', 'col_offset', 'end_lineno', 'end_col_offset')
+    __match_args__ = _fields = ('arg', 'value')
 
     def __init__(self, arg: Optional[str], value: expr, *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.arg = arg
@@ -1077,8 +979,8 @@ class keyword(AST):
 
 
 class alias(AST):
-    __match_args__ = ('name', 'asname')
-    _fields = ('name', 'asname')
+    __slots__ = ('name', 'asname', 'lineno', 'col_offset', 'end_lineno', 'end_col_offset')
+    __match_args__ = _fields = ('name', 'asname')
 
     def __init__(self, name: str, asname: Optional[str], *, lineno: int, col_offset: int, end_lineno: Optional[int], end_col_offset: Optional[int]) -> None:
         self.name = name
@@ -1090,8 +992,7 @@ class alias(AST):
 
 
 class withitem(AST):
-    __match_args__ = ('context_expr', 'optional_vars')
-    _fields = ('context_expr', 'optional_vars')
+    __slots__ = __match_args__ = _fields = ('context_expr', 'optional_vars')
 
     def __init__(self, context_expr: expr, optional_vars: Optional[expr]) -> None:
         self.context_expr = context_expr
@@ -1099,8 +1000,7 @@ class withitem(AST):
 
 
 class match_case(AST):
-    __match_args__ = ('pattern', 'guard', 'body')
-    _fields = ('pattern', 'guard', 'body')
+    __slots__ = __match_args__ = _fields = ('pattern', 'guard', 'body')
 
     def __init__(self, pattern: pattern, guard: Optional[expr], body: list[stmt]) -> None:
         self.pattern = pattern
@@ -1109,19 +1009,11 @@ class match_case(AST):
 
 
 class pattern(AST):
-    __match_args__ = ()
-    _fields = ()
-
-    def __init__(self, *, lineno: int, col_offset: int, end_lineno: int, end_col_offset: int) -> None:
-        self.lineno = lineno
-        self.col_offset = col_offset
-        self.end_lineno = end_lineno
-        self.end_col_offset = end_col_offset
+    __slots__ = ('lineno', 'col_offset', 'end_lineno', 'end_col_offset')
 
 
 class MatchValue(pattern):
-    __match_args__ = ('value')
-    _fields = ('value')
+    __slots__ = __match_args__ = _fields = ('value',)
 
     def __init__(self, value: expr, *, lineno: int, col_offset: int, end_lineno: int, end_col_offset: int) -> None:
         self.value = value
@@ -1132,8 +1024,7 @@ class MatchValue(pattern):
 
 
 class MatchSingleton(pattern):
-    __match_args__ = ('value')
-    _fields = ('value')
+    __slots__ = __match_args__ = _fields = ('value',)
 
     def __init__(self, value: object, *, lineno: int, col_offset: int, end_lineno: int, end_col_offset: int) -> None:
         self.value = value
@@ -1144,8 +1035,7 @@ class MatchSingleton(pattern):
 
 
 class MatchSequence(pattern):
-    __match_args__ = ('patterns')
-    _fields = ('patterns')
+    __slots__ = __match_args__ = _fields = ('patterns',)
 
     def __init__(self, patterns: list[pattern], *, lineno: int, col_offset: int, end_lineno: int, end_col_offset: int) -> None:
         self.patterns = patterns
@@ -1156,8 +1046,7 @@ class MatchSequence(pattern):
 
 
 class MatchMapping(pattern):
-    __match_args__ = ('keys', 'patterns', 'rest')
-    _fields = ('keys', 'patterns', 'rest')
+    __slots__ = __match_args__ = _fields = ('keys', 'patterns', 'rest')
 
     def __init__(self, keys: list[expr], patterns: list[pattern], rest: Optional[str], *, lineno: int, col_offset: int, end_lineno: int, end_col_offset: int) -> None:
         self.keys = keys
@@ -1170,8 +1059,7 @@ class MatchMapping(pattern):
 
 
 class MatchClass(pattern):
-    __match_args__ = ('cls', 'patterns', 'kwd_attrs', 'kwd_patterns')
-    _fields = ('cls', 'patterns', 'kwd_attrs', 'kwd_patterns')
+    __slots__ = __match_args__ = _fields = ('cls', 'patterns', 'kwd_attrs', 'kwd_patterns')
 
     def __init__(self, cls: expr, patterns: list[pattern], kwd_attrs: list[str], kwd_patterns: list[pattern], *, lineno: int, col_offset: int, end_lineno: int, end_col_offset: int) -> None:
         self.cls = cls
@@ -1185,8 +1073,7 @@ class MatchClass(pattern):
 
 
 class MatchStar(pattern):
-    __match_args__ = ('name')
-    _fields = ('name')
+    __slots__ = __match_args__ = _fields = ('name',)
 
     def __init__(self, name: Optional[str], *, lineno: int, col_offset: int, end_lineno: int, end_col_offset: int) -> None:
         self.name = name
@@ -1197,8 +1084,7 @@ class MatchStar(pattern):
 
 
 class MatchAs(pattern):
-    __match_args__ = ('pattern', 'name')
-    _fields = ('pattern', 'name')
+    __slots__ = __match_args__ = _fields = ('pattern', 'name')
 
     def __init__(self, pattern: Optional[pattern], name: Optional[str], *, lineno: int, col_offset: int, end_lineno: int, end_col_offset: int) -> None:
         self.pattern = pattern
@@ -1210,8 +1096,7 @@ class MatchAs(pattern):
 
 
 class MatchOr(pattern):
-    __match_args__ = ('patterns')
-    _fields = ('patterns')
+    __slots__ = __match_args__ = _fields = ('patterns',)
 
     def __init__(self, patterns: list[pattern], *, lineno: int, col_offset: int, end_lineno: int, end_col_offset: int) -> None:
         self.patterns = patterns
@@ -1222,13 +1107,11 @@ class MatchOr(pattern):
 
 
 class type_ignore(AST):
-    __match_args__ = ()
-    _fields = ()
+    __slots__ = ()
 
 
 class TypeIgnore(type_ignore):
-    __match_args__ = ('lineno', 'tag')
-    _fields = ('lineno', 'tag')
+    __slots__ = __match_args__ = _fields = ('lineno', 'tag')
 
     def __init__(self, lineno: int, tag: str) -> None:
         self.lineno = lineno
@@ -1236,19 +1119,11 @@ class TypeIgnore(type_ignore):
 
 
 class type_param(AST):
-    __match_args__ = ()
-    _fields = ()
-
-    def __init__(self, *, lineno: int, col_offset: int, end_lineno: int, end_col_offset: int) -> None:
-        self.lineno = lineno
-        self.col_offset = col_offset
-        self.end_lineno = end_lineno
-        self.end_col_offset = end_col_offset
+    __slots__ = ('lineno', 'col_offset', 'end_lineno', 'end_col_offset')
 
 
 class TypeVar(type_param):
-    __match_args__ = ('name', 'bound', 'default_value')
-    _fields = ('name', 'bound', 'default_value')
+    __slots__ = __match_args__ = _fields = ('name', 'bound', 'default_value')
 
     def __init__(self, name: str, bound: Optional[expr], default_value: Optional[expr], *, lineno: int, col_offset: int, end_lineno: int, end_col_offset: int) -> None:
         self.name = name
@@ -1261,8 +1136,7 @@ class TypeVar(type_param):
 
 
 class ParamSpec(type_param):
-    __match_args__ = ('name', 'default_value')
-    _fields = ('name', 'default_value')
+    __slots__ = __match_args__ = _fields = ('name', 'default_value')
 
     def __init__(self, name: str, default_value: Optional[expr], *, lineno: int, col_offset: int, end_lineno: int, end_col_offset: int) -> None:
         self.name = name
@@ -1274,8 +1148,7 @@ class ParamSpec(type_param):
 
 
 class TypeVarTuple(type_param):
-    __match_args__ = ('name', 'default_value')
-    _fields = ('name', 'default_value')
+    __slots__ = __match_args__ = _fields = ('name', 'default_value')
 
     def __init__(self, name: str, default_value: Optional[expr], *, lineno: int, col_offset: int, end_lineno: int, end_col_offset: int) -> None:
         self.name = name
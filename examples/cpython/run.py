@@ -22,11 +22,12 @@ class TimeCatcher:
     """
 
     def __enter__(self):
-        self.elapsed = time.perf_counter()
+        self.elapsed = time.perf_counter_ns()
         return self
 
     def __exit__(self, *_exc_info: object):
-        self.elapsed = time.perf_counter() - self.elapsed
+        # Keep the timing in integer nanoseconds and only convert to seconds at the end.
+        self.elapsed = (time.perf_counter_ns() - self.elapsed) / 1e9
 
 
 def main() -> None:
@@ -39,12 +40,21 @@ def main() -> None:
     with TimeCatcher() as tc:
         code = pyasdl.generate_code(source)
 
-    with output_path.open("w", encoding="utf-8") as fp:
-        fp.write("# ruff: noqa: INP001, PLR0913, A002\n")
-        fp.write("\n")
-        fp.write('"""Class definitions representing the AST nodes outlined in Python.asdl. Generated by run.py."""\n')
-        fp.write("\n")
-        fp.write(code)
+    output = "".join(
+        (
+            "# ruff: noqa: INP001, PLR0913, A002\n",
+            "\n",
+            '"""Class definitions representing the AST nodes outlined in Python.asdl. Generated by run.py."""\n',
+            "\n",
+            code,
+        )
+    )
+
+    # Skip rewriting the output if it's already up to date, so its modification time only changes with its contents.
+    if output_path.is_file() and output_path.read_text("utf-8") == output:
+        print("Output is already up to date.")
+    else:
+        output_path.write_text(output, "utf-8")
 
     print(f"Time taken: {tc.elapsed}")
 
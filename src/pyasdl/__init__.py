@@ -32,13 +32,28 @@ References
 
 from __future__ import annotations
 
+import re
 import sys
-from collections import deque
-from collections.abc import Generator, Iterable, Iterator
-from enum import Enum, auto
-from io import StringIO
-from types import GeneratorType
-from typing import TYPE_CHECKING, Any, Optional, Union
+from array import array
+from collections import defaultdict
+from collections.abc import Callable, Generator, Iterable
+from enum import IntEnum, auto
+from functools import lru_cache
+from operator import attrgetter
+from types import GeneratorType, ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    NamedTuple,
+    Optional,
+    TextIO,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 
 # Use a shim to avoid a runtime dependency on typing-extensions.
@@ -82,7 +97,7 @@ class ASDLSyntaxError(Exception):
 # ============================================================================
 
 
-class TokenKind(Enum):
+class TokenKind(IntEnum):
     """The kinds of tokens that an ASDL specification can contain."""
 
     # fmt: off
@@ -97,9 +112,24 @@ class TokenKind(Enum):
     RPAREN          = auto()
     LBRACE          = auto()
     RBRACE          = auto()
+    EOF             = auto()
     # fmt: on
 
 
+# Aliases for the token kinds used in the tokenizer and parser hot paths. Looking a member up on the enum class every
+# time is much slower than loading a module global.
+_CONSTRUCTOR_ID = TokenKind.CONSTRUCTOR_ID
+_TYPE_ID = TokenKind.TYPE_ID
+_EQUALS = TokenKind.EQUALS
+_COMMA = TokenKind.COMMA
+_PIPE = TokenKind.PIPE
+_LPAREN = TokenKind.LPAREN
+_RPAREN = TokenKind.RPAREN
+_LBRACE = TokenKind.LBRACE
+_RBRACE = TokenKind.RBRACE
+_EOF = TokenKind.EOF
+
+
 OPERATOR_TOKEN_TABLE = {
     "=": TokenKind.EQUALS,
     ",": TokenKind.COMMA,
@@ -113,25 +143,89 @@ OPERATOR_TOKEN_TABLE = {
 }
 
 
-class Token:
-    __slots__ = ("kind", "value", "lineno")
+class Token(NamedTuple):
+    kind: TokenKind
+    value: str
+    lineno: int
 
-    def __init__(self, kind: TokenKind, value: str, lineno: int):
-        self.kind = kind
-        self.value = value
-        self.lineno = lineno
 
-    def __repr__(self):
-        return f"{self.__class__.__name__}(kind={self.kind!r}, value={self.value!r}, lineno={self.lineno})"
+# Maps the integer value of each token kind back to its member, without the overhead of calling TokenKind().
+_TOKEN_KINDS: dict[int, TokenKind] = {kind.value: kind for kind in TokenKind}
 
+# Each alternative is a named group so that a match can be dispatched on via its lastgroup. Identifiers are spelled
+# out as ASCII ranges, whitespace matches what str.isspace() accepts, and comments end at any line break that
+# str.splitlines() recognizes.
+_TOKEN_PATTERN = re.compile(
+    r"(?P<WHITESPACE>\s+)"
+    r"|(?P<COMMENT>--[^\n\r\v\f\x1c-\x1e\x85\u2028\u2029]*)"
+    r"|(?P<CONSTRUCTOR_ID>[A-Z][A-Za-z_]*)"
+    r"|(?P<TYPE_ID>[a-z][A-Za-z_]*)"
+    r"|(?P<OPERATOR>[=,?|()*{}])"
+    r"|(?P<INVALID>.)"
+)
 
-def tokenize(source: str) -> Generator[Token]:
-    """Tokenize a source.
+# The line boundaries recognized by str.splitlines(), so that line numbers match a line-by-line reading of the source.
+_LINE_BREAK_PATTERN = re.compile(r"\r\n|[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]")
 
-    Yields
-    ------
-    Token
-        An token representation, which holds the token kind, value, and line number.
+
+def _scan_tokens(source: str) -> Generator[tuple[TokenKind, str, int]]:
+    """Scan a source for tokens, yielding each one's kind, value, and line number as it's found.
+
+    This is the single tokenizer loop behind both ``tokenize()`` and ``tokenize_packed()``. The last token is always an
+    EOF token with an empty value.
+    """
+
+    # Bind the lookups used for every token to locals, which are cheaper to load than globals and attributes.
+    intern = sys.intern
+    operator_kinds = OPERATOR_TOKEN_TABLE
+    type_id = _TYPE_ID
+    constructor_id = _CONSTRUCTOR_ID
+    find_line_breaks = _LINE_BREAK_PATTERN.findall
+
+    line_no = 1
+
+    # Scan the whole source at once instead of line by line.
+    for match in _TOKEN_PATTERN.finditer(source):
+        group = match.lastgroup
+
+        # Capture identifiers. The pattern already tells constructor and type identifiers apart by their first letter.
+        # Intern identifiers so that repeated names share one string and keyword checks hit the identity fast path.
+        if group == "TYPE_ID":
+            yield type_id, intern(match.group()), line_no
+
+        elif group == "CONSTRUCTOR_ID":
+            yield constructor_id, intern(match.group()), line_no
+
+        # Capture operators. They can only be 1 character long.
+        elif group == "OPERATOR":
+            value = match.group()
+            yield operator_kinds[value], value, line_no
+
+        # Whitespace is discarded, but can span multiple lines.
+        elif group == "WHITESPACE":
+            line_no += len(find_line_breaks(match.group()))
+
+        # Panic if we encounter something unknown.
+        elif group == "INVALID":
+            msg = f"Invalid operator {match.group()}"
+            raise ASDLSyntaxError(msg, line_no)
+
+        # Comments (which run to the end of the line) are discarded.
+
+    yield _EOF, "", line_no
+
+
+def tokenize_packed(source: str) -> tuple[array[int], list[str], array[int]]:
+    """Tokenize a source into parallel sequences of token kinds, values, and line numbers.
+
+    This is the representation the parser works on. It avoids allocating an object per token, and the parser usually
+    only needs to look at one of the three parts of a token at a time.
+
+    Returns
+    -------
+    tuple[array[int], list[str], array[int]]
+        The token kinds (as ``TokenKind`` values), values, and line numbers. The last token is always an EOF token with
+        an empty value, so the parser never has to check if it's run out of tokens.
 
     Raises
     ------
@@ -139,50 +233,43 @@ def tokenize(source: str) -> Generator[Token]:
         If something unknown is encountered during tokenization.
     """
 
-    for line_no, line in enumerate(source.splitlines(), start=1):
-        col_no = 0
+    kinds: array[int] = array("b")
+    values: list[str] = []
+    linenos: array[int] = array("i")
 
-        while col_no < len(line):
-            char = line[col_no]
+    # Bind the appends used for every token to locals, which are cheaper to load than attributes.
+    add_kind = kinds.append
+    add_value = values.append
+    add_lineno = linenos.append
 
-            # Discard whitespace.
-            if char.isspace():
-                col_no += 1
+    for kind, value, line_no in _scan_tokens(source):
+        add_kind(kind)
+        add_value(value)
+        add_lineno(line_no)
 
-            # Capture identifiers.
-            elif char.isalpha():
-                id_start = col_no
-                col_no += 1
+    return kinds, values, linenos
 
-                # Find the end of the identifier. Default to the end of the line.
-                for idx in range(id_start + 1, len(line)):
-                    if not (line[idx].isalpha() or line[idx] == "_"):
-                        col_no = idx
-                        break
-                else:
-                    col_no = len(line)
 
-                if char.isupper():
-                    id_kind = TokenKind.CONSTRUCTOR_ID
-                else:
-                    id_kind = TokenKind.TYPE_ID
+def tokenize(source: str) -> Generator[Token]:
+    """Tokenize a source.
 
-                yield Token(id_kind, line[id_start:col_no], line_no)
+    Yields
+    ------
+    Token
+        An token representation, which holds the token kind, value, and line number.
 
-            # Discard the line from the comment onwards.
-            elif line.startswith("--", col_no):
-                break
+    Raises
+    ------
+    ASDLSyntaxError
+        If something unknown is encountered during tokenization. The tokens before it are still yielded first.
+    """
 
-            # Capture operators.
-            elif (op_kind := OPERATOR_TOKEN_TABLE.get(char)) is not None:
-                # Operators can only be 1 character long.
-                col_no += 1
-                yield Token(op_kind, char, line_no)
+    for kind, value, line_no in _scan_tokens(source):
+        # The EOF token is only for the parser's benefit.
+        if kind is _EOF:
+            break
 
-            # Panic if we encounter something unknown.
-            else:
-                msg = f"Invalid operator {char}"
-                raise ASDLSyntaxError(msg, line_no)
+        yield Token(kind, value, line_no)
 
 
 # endregion
@@ -200,11 +287,19 @@ def tokenize(source: str) -> Generator[Token]:
 # ============================================================================
 
 
-class FieldQuantifier(Enum):
+class FieldQuantifier(IntEnum):
     SEQ = auto()
     OPT = auto()
 
 
+# How each quantifier is written after a field's type in ASDL.
+_QUANTIFIER_SUFFIXES: dict[Optional[FieldQuantifier], str] = {
+    None: "",
+    FieldQuantifier.SEQ: "*",
+    FieldQuantifier.OPT: "?",
+}
+
+
 class AST:
     __slots__ = ("__weakref__",)
     __match_args__ = _fields = ()
@@ -213,9 +308,9 @@ class AST:
 class Module(AST):
     __slots__ = __match_args__ = _fields = ("name", "dfns")
 
-    def __init__(self, name: str, dfns: list[Type] = _empty):
+    def __init__(self, name: str, dfns: list[Type]):
         self.name = name
-        self.dfns = dfns if (dfns is not _empty) else []
+        self.dfns = dfns
 
 
 class Type(AST):
@@ -229,25 +324,25 @@ class Type(AST):
 class Sum(AST):
     __slots__ = __match_args__ = _fields = ("types", "attributes")
 
-    def __init__(self, types: list[Constructor] = _empty, attributes: list[Field] = _empty):
-        self.types = types if (types is not _empty) else []
-        self.attributes = attributes if (attributes is not _empty) else []
+    def __init__(self, types: list[Constructor], attributes: list[Field]):
+        self.types = types
+        self.attributes = attributes
 
 
 class Product(AST):
     __slots__ = __match_args__ = _fields = ("fields", "attributes")
 
-    def __init__(self, fields: list[Field] = _empty, attributes: list[Field] = _empty):
-        self.fields = fields if (fields is not _empty) else []
-        self.attributes = attributes if (attributes is not _empty) else []
+    def __init__(self, fields: list[Field], attributes: list[Field]):
+        self.fields = fields
+        self.attributes = attributes
 
 
 class Constructor(AST):
     __slots__ = __match_args__ = _fields = ("name", "fields")
 
-    def __init__(self, name: str, fields: list[Field] = _empty):
+    def __init__(self, name: str, fields: list[Field]):
         self.name = name
-        self.fields = fields if (fields is not _empty) else []
+        self.fields = fields
 
 
 class Field(AST):
@@ -264,14 +359,7 @@ class Field(AST):
         self.quantifier = quantifier
 
     def __str__(self):
-        if self.quantifier is FieldQuantifier.SEQ:
-            extra = "*"
-        elif self.quantifier is FieldQuantifier.OPT:
-            extra = "?"
-        else:
-            extra = ""
-
-        return f"{self.type}{extra} {self.name}"
+        return f"{self.type}{_QUANTIFIER_SUFFIXES[self.quantifier]} {self.name}"
 
 
 # endregion
@@ -284,31 +372,118 @@ class Field(AST):
 # ============================================================================
 
 
-def iter_child_nodes(node: AST) -> Generator[AST]:
-    """Yield all direct child nodes of a given node.
+_ChildExtractor: TypeAlias = Callable[[AST], list[AST]]
+
+# Functions that return the direct child nodes of a node, keyed by node class. They are built on first use, since the
+# type hints they are derived from can contain forward references.
+_CHILD_EXTRACTORS: dict[type[AST], _ChildExtractor] = {}
 
-    This includes all fields that are nodes and all items of fields that are lists of nodes.
-    """
+
+def _find_children(node: AST) -> list[AST]:
+    """Return the direct child nodes of a node by checking the type of every field value."""
+
+    children: list[AST] = []
 
     for node_field in node._fields:
         potential_subnode = getattr(node, node_field)
 
         if isinstance(potential_subnode, AST):
-            yield potential_subnode
+            children.append(potential_subnode)
 
         elif isinstance(potential_subnode, list):
-            for subsub in potential_subnode:  # pyright: ignore [reportUnknownVariableType]
-                if isinstance(subsub, AST):
-                    yield subsub
+            children.extend(subsub for subsub in potential_subnode if isinstance(subsub, AST))  # pyright: ignore [reportUnknownVariableType]
+
+    return children
+
+
+def _may_hold_nodes(hint: Any) -> bool:
+    """Check whether a field with the given type hint could hold meta-AST nodes or lists of them.
+
+    Only hints that are plainly unrelated to nodes, e.g. ``str`` or ``Optional[FieldQuantifier]``, rule that out.
+    Anything that isn't understood is assumed to possibly hold nodes.
+    """
+
+    origin = get_origin(hint)
+
+    if origin is Union:
+        return any(_may_hold_nodes(arg) for arg in get_args(hint))
+    elif origin is list:
+        args = get_args(hint)
+        return not args or _may_hold_nodes(args[0])
+    elif hint is Any or hint is object:
+        # Any is a class on Python 3.11+, so it has to be caught before the class check.
+        return True
+    elif origin is None and isinstance(hint, type):
+        return issubclass(hint, (AST, list))
+    else:
+        return True
+
+
+def _make_child_extractor(cls: type[AST]) -> _ChildExtractor:
+    """Build a function that returns the direct child nodes of instances of the given node class.
+
+    Fields whose type hints in the class's ``__init__`` rule out nodes are skipped, which is decided once per class.
+    The values of the remaining fields are still checked like in ``_find_children()``. Classes whose type hints can't
+    be resolved fall back to checking every field.
+    """
+
+    try:
+        hints = get_type_hints(cls.__init__)
+    except Exception:  # noqa: BLE001 # Any failure to evaluate the hints just means they can't be used.
+        return _find_children
+
+    child_getters = [
+        attrgetter(node_field)
+        for node_field in cls._fields
+        if node_field not in hints or _may_hold_nodes(hints[node_field])
+    ]
+
+    def extract_children(node: AST) -> list[AST]:
+        children: list[AST] = []
+
+        for getter in child_getters:
+            potential_subnode = getter(node)
+
+            if isinstance(potential_subnode, AST):
+                children.append(potential_subnode)
+
+            elif isinstance(potential_subnode, list):
+                children.extend(subsub for subsub in potential_subnode if isinstance(subsub, AST))  # pyright: ignore [reportUnknownVariableType]
+
+        return children
+
+    return extract_children
+
+
+def _children(node: AST) -> list[AST]:
+    """Return a list of all direct child nodes of a given node."""
+
+    node_cls = type(node)
+
+    try:
+        extractor = _CHILD_EXTRACTORS[node_cls]
+    except KeyError:
+        extractor = _CHILD_EXTRACTORS[node_cls] = _make_child_extractor(node_cls)
+
+    return extractor(node)
+
+
+def iter_child_nodes(node: AST) -> Generator[AST]:
+    """Yield all direct child nodes of a given node.
+
+    This includes all fields that are nodes and all items of fields that are lists of nodes.
+    """
+
+    yield from _children(node)
 
 
 def walk(node: AST) -> Generator[AST]:
     """Walk through an AST, breadth first."""
 
-    stack: deque[AST] = deque([node])
-    while stack:
-        curr_node = stack.popleft()
-        stack.extend(iter_child_nodes(curr_node))
+    # A list iterator picks up items appended during iteration, so this visits the nodes in queue order without popping.
+    queue: list[AST] = [node]
+    for curr_node in queue:
+        queue.extend(_children(curr_node))
         yield curr_node
 
 
@@ -320,35 +495,91 @@ class NodeVisitor:
     The generator-based implemention is based on a talk by David Beazley called "Generators: The Final Frontier".
     """
 
-    def _visit(self, node: AST) -> Generator[Any, Any, Any]:
-        """Wrapper for visit methods to ensure visit() only deals with generators."""
+    # Names of the visit methods by node class name, built once per subclass. Only the names are stored, so the methods
+    # are still looked up and bound on the instance, e.g. staticmethods work.
+    _visit_method_names: ClassVar[dict[str, str]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        cls._visit_method_names = {name.removeprefix("visit_"): name for name in dir(cls) if name.startswith("visit_")}
+
+    def _enter(self, node: AST, stack: list[tuple[Generator[Any, Any, Any], bool]]) -> Any:
+        """Call the visit method for a node, pushing a frame onto the stack if it has children to visit.
+
+        Nodes that fall back to the default generic visit get their child iterator as a frame directly, which can be
+        advanced with next() instead of sending into a wrapping generator and catching StopIteration.
+        """
+
+        node_name = type(node).__name__
+        visitor_name = self._visit_method_names.get(node_name)
+
+        if visitor_name is not None:
+            visitor = getattr(self, visitor_name)
+        else:
+            # Visit methods can also come from the instance, be added to the class later, or come from __getattr__.
+            visitor = getattr(self, "visit_" + node_name, None)
 
-        result: Any = getattr(self, f"visit_{node.__class__.__name__}", self.generic_visit)(node)
+            if visitor is None:
+                visitor = self.generic_visit
+
+                if getattr(visitor, "__func__", None) is NodeVisitor.generic_visit:
+                    stack.append((iter_child_nodes(node), False))
+                    return None
+
+        result: Any = visitor(node)
         if isinstance(result, GeneratorType):
-            result = yield from result
+            stack.append((cast("Generator[Any, Any, Any]", result), True))
+            return None
         return result
 
-    def visit(self, node: AST) -> Any:
+    def visit(self, node: AST) -> Any:  # noqa: PLR0912 # Keeping the trampoline in one loop avoids call overhead.
         """Visit a node."""
 
-        stack: deque[Generator[Any, Any, Any]] = deque([self._visit(node)])
+        stack: list[tuple[Generator[Any, Any, Any], bool]] = []
         result: Any = None
         exception: Optional[BaseException] = None
+        next_node: Any = node
+
+        while True:
+            if next_node is not _empty:
+                try:
+                    result = self._enter(next_node, stack)
+                except BaseException as exc:  # noqa: BLE001 # The exception is propogated.
+                    exception = exc
+                next_node = _empty
+
+            if not stack:
+                break
+
+            frame, is_generator = stack[-1]
+
+            if not is_generator:
+                # Plain child iterators discard results and can't handle exceptions, so the latter keep propagating.
+                # Exceptions from getting the next child are propagated the same way.
+                if exception is None:
+                    try:
+                        next_node = next(frame, _empty)
+                    except BaseException as exc:  # noqa: BLE001 # The exception is propogated.
+                        exception = exc
+                if next_node is _empty:
+                    stack.pop()
+                    result = None
+                continue
 
-        while stack:
             try:
                 if exception is not None:
-                    node = stack[-1].throw(exception)
+                    next_node = frame.throw(exception)
                 else:
-                    node = stack[-1].send(result)
-            except StopIteration as exc:  # noqa: PERF203 # This loop cannot avoid exceptions as control flow.
+                    next_node = frame.send(result)
+            except StopIteration as exc:  # Only generator frames use exceptions as control flow.
                 stack.pop()
                 result = exc.value
+                exception = None
             except BaseException as exc:  # noqa: BLE001 # The exception is propogated.
                 stack.pop()
                 exception = exc
             else:
-                stack.append(self._visit(node))
                 result = None
                 exception = None
 
@@ -374,46 +605,118 @@ class NodeVisitor:
 # ============================================================================
 
 
-TOKEN_TO_FIELD_QUANTIFIER = {
+TOKEN_TO_FIELD_QUANTIFIER: dict[int, FieldQuantifier] = {
     TokenKind.ASTERISK: FieldQuantifier.SEQ,
     TokenKind.QUESTION: FieldQuantifier.OPT,
 }
 
 
-# TODO: For fun, switch from recursive to iterative via generators and maybe a trampoline.
 class ASDLParser:
     """Parser for ASDL descriptions.
 
-    This is a simple recursive descent parser that acts on an iterable of tokens.
+    This is a simple recursive descent parser that acts on an iterable of tokens. The tokens are stored as parallel
+    sequences of kinds, values, and line numbers (see ``tokenize_packed()``), so that moving through them is just a
+    matter of incrementing an index.
+
+    ASDL definitions don't nest, so the recursion never goes deeper than module, type, constructor, and fields,
+    regardless of the size of the description.
     """
 
     def __init__(self):
-        # NOTE: Using _empty like this is hacky.
-        self._tokenizer: Iterator[Token] = _empty
-        self.cur_token: Token = _empty
+        self._kinds: array[int] = array("b")
+        self._values: list[str] = []
+        self._linenos: array[int] = array("i")
+        self._pos: int = 0
+
+    @property
+    def cur_token(self) -> Token:
+        """The token currently being looked at."""
+
+        pos = self._pos
+        return Token(_TOKEN_KINDS[self._kinds[pos]], self._values[pos], self._linenos[pos])
 
     def parse(self, tokens: Iterable[Token]) -> Module:
         """Parse the ASDL token stream and return an AST with a Module root."""
 
-        self._tokenizer = iter(tokens)
-        self.cur_token = next(self._tokenizer)  # Prime the current token.
+        kinds: array[int] = array("b")
+        values: list[str] = []
+        linenos: array[int] = array("i")
+
+        for token in tokens:
+            kinds.append(token.kind)
+            values.append(token.value)
+            linenos.append(token.lineno)
+
+        if not kinds or kinds[-1] != _EOF:
+            kinds.append(_EOF)
+            values.append("")
+            linenos.append(linenos[-1] if linenos else 1)
+
+        return self.parse_packed(kinds, values, linenos)
+
+    def parse_packed(self, kinds: array[int], values: list[str], linenos: array[int]) -> Module:
+        """Parse ASDL tokens given as parallel sequences of kinds, values, and line numbers and return an AST with a
+        Module root.
 
+        The sequences must end with an EOF token, like the ones returned by ``tokenize_packed()``.
+        """
+
+        self._kinds = kinds
+        self._values = values
+        self._linenos = linenos
+        self._pos = 0
+
+        self._check_brackets()
         return self.parse_module()
 
+    def _check_brackets(self) -> None:
+        """Fail fast if the parentheses or braces in the token stream can't be balanced.
+
+        Counting kinds in the packed array happens in C, so well-formed input only pays for a few passes over bytes.
+        Only unbalanced input falls back to a Python scan, to report where the problem is.
+        """
+
+        kinds = self._kinds
+        if kinds.count(_LPAREN) == kinds.count(_RPAREN) and kinds.count(_LBRACE) == kinds.count(_RBRACE):
+            return
+
+        closers: dict[int, TokenKind] = {_LPAREN: _RPAREN, _LBRACE: _RBRACE}
+        open_brackets: list[int] = []
+
+        for pos, kind in enumerate(kinds):
+            if kind in closers:
+                open_brackets.append(pos)
+            elif kind in (_RPAREN, _RBRACE):
+                if not open_brackets:
+                    msg = f"Unmatched {TokenKind(kind).name}"
+                    raise ASDLSyntaxError(msg, self._linenos[pos])
+
+                expected = closers[kinds[open_brackets.pop()]]
+                if expected != kind:
+                    msg = f"Unmatched {expected.name} (found {TokenKind(kind).name})"
+                    raise ASDLSyntaxError(msg, self._linenos[pos])
+
+        # The innermost bracket is the one that was left open.
+        pos = open_brackets[-1]
+        msg = f"Unclosed {TokenKind(kinds[pos]).name}"
+        raise ASDLSyntaxError(msg, self._linenos[pos])
+
     # region ---- Parsing helpers -----
 
     def advance(self) -> str:
-        """Return the value of the current token and read the next one into self.cur_token."""
+        """Return the value of the current token and move on to the next one."""
 
-        cur_val = self.cur_token.value
-        self.cur_token = next(self._tokenizer, _empty)  # A default here prevents the last token from causing an error.
+        cur_val = self._values[self._pos]
+        self._pos += 1
         return cur_val
 
     def at_kind(self, kind: Union[TokenKind, tuple[TokenKind, ...]], /) -> bool:
+        cur_kind = self._kinds[self._pos]
+
         if isinstance(kind, tuple):
-            return self.cur_token.kind in kind
+            return cur_kind in kind
         else:
-            return self.cur_token.kind is kind
+            return cur_kind == kind
 
     def at_keyword(self, keyword: str, /) -> bool:
         """Check if the current token is an identifier and matches the given keyword.
@@ -421,44 +724,63 @@ class ASDLParser:
         It does not advance to the next token.
         """
 
-        return self.cur_token.kind is TokenKind.TYPE_ID and self.cur_token.value == keyword
+        pos = self._pos
+        return self._kinds[pos] == _TYPE_ID and self._values[pos] == keyword
 
-    def match(self, kind: Union[TokenKind, tuple[TokenKind, ...]], /) -> str:
+    def match(self, kind: TokenKind, /) -> str:
         """The 'match' primitive of RD parsers.
 
-        *   Verifies that the current token is of the given kind (kind can be a tuple, in which the kind must match one
-            of its members).
+        *   Verifies that the current token is of the given kind
         *   Returns the value of the current token
         *   Reads in the next token
         """
 
-        if self.at_kind(kind):
-            value = self.cur_token.value
-            self.advance()
-            return value
+        # The checks from at_kind() and advance() are inlined, since this runs for most tokens.
+        pos = self._pos
+
+        if self._kinds[pos] == kind:
+            self._pos = pos + 1
+            return self._values[pos]
         else:
-            msg = f"Unmatched {kind} (found {self.cur_token.kind})"
-            raise ASDLSyntaxError(msg, self.cur_token.lineno)
+            raise self._unmatched_error(kind.name)
+
+    def match_any(self, kinds: tuple[TokenKind, ...], /) -> str:
+        """Like ``match()``, but the current token can be of any of the given kinds."""
+
+        pos = self._pos
+
+        if self._kinds[pos] in kinds:
+            self._pos = pos + 1
+            return self._values[pos]
+        else:
+            raise self._unmatched_error(" or ".join(k.name for k in kinds))
+
+    def _unmatched_error(self, expected: str) -> ASDLSyntaxError:
+        cur_token = self.cur_token
+        msg = f"Unmatched {expected} (found {cur_token.kind.name})"
+        return ASDLSyntaxError(msg, cur_token.lineno)
 
     # endregion
 
     # region ---- Parsing rules ----
 
     # Rule: id ::= TypeId | ConstructorId
-    ID_KINDS = (TokenKind.TYPE_ID, TokenKind.CONSTRUCTOR_ID)
+    ID_KINDS = (_TYPE_ID, _CONSTRUCTOR_ID)
 
     def parse_module(self) -> Module:
         # Rule: module ::= "module" id "{" [definitions] "}"
 
         if not self.at_keyword("module"):
-            msg = f'Expected "module" (found {self.cur_token.value})'
-            raise ASDLSyntaxError(msg, self.cur_token.lineno)
+            cur_token = self.cur_token
+            found = cur_token.value or cur_token.kind.name  # The EOF token has no value to show.
+            msg = f'Expected "module" (found {found})'
+            raise ASDLSyntaxError(msg, cur_token.lineno)
 
         self.advance()
-        name = self.match(self.ID_KINDS)
-        self.match(TokenKind.LBRACE)
+        name = self.match_any(self.ID_KINDS)
+        self.match(_LBRACE)
         defs = self.parse_definitions()
-        self.match(TokenKind.RBRACE)
+        self.match(_RBRACE)
         return Module(name, defs)
 
     def parse_definitions(self) -> list[Type]:
@@ -466,9 +788,9 @@ class ASDLParser:
 
         defs: list[Type] = []
 
-        while self.at_kind(TokenKind.TYPE_ID):
+        while self.at_kind(_TYPE_ID):
             typename = self.advance()
-            self.match(TokenKind.EQUALS)
+            self.match(_EQUALS)
             type_ = self.parse_type()
             defs.append(Type(typename, type_))
 
@@ -477,7 +799,7 @@ class ASDLParser:
     def parse_type(self) -> Union[Product, Sum]:
         # Rule: type ::= product | sum
 
-        if self.at_kind(TokenKind.LPAREN):
+        if self.at_kind(_LPAREN):
             return self.parse_product()
         else:
             return self.parse_sum()
@@ -491,11 +813,22 @@ class ASDLParser:
         # Rule: sum           ::= constructor { "|" constructor } ["attributes" fields]
         # Rule: constructor   ::= ConstructorId [fields]
 
-        sumlist = [Constructor(self.match(TokenKind.CONSTRUCTOR_ID), self.parse_optional_fields())]
-        while self.at_kind(TokenKind.PIPE):
+        sumlist: list[Constructor] = []
+
+        while True:
+            name = self.match(_CONSTRUCTOR_ID)
+
+            if self.at_kind(_LPAREN):
+                sumlist.append(Constructor(name, self.parse_fields()))
+            else:
+                sumlist.append(Constructor(name, []))
+
             # More constructors
+            if not self.at_kind(_PIPE):
+                break
+
             self.advance()
-            sumlist.append(Constructor(self.match(TokenKind.CONSTRUCTOR_ID), self.parse_optional_fields()))
+
         return Sum(sumlist, self.parse_optional_attributes())
 
     def parse_fields(self) -> list[Field]:
@@ -503,30 +836,41 @@ class ASDLParser:
         # Rule: field   ::= TypeId ["?" | "*"] [id]
 
         fields: list[Field] = []
-        self.match(TokenKind.LPAREN)
-
-        while self.at_kind(TokenKind.TYPE_ID):
-            typename = self.advance()
-            field_quantifier = self.parse_optional_field_quantifier()
-            id_ = self.advance() if self.at_kind(self.ID_KINDS) else None
+        self.match(_LPAREN)
+
+        # This is the hottest rule, so work on local copies of the token arrays and cursor, and only write the cursor
+        # back before handing off to match().
+        kinds = self._kinds
+        values = self._values
+        id_kinds = self.ID_KINDS
+        pos = self._pos
+
+        while kinds[pos] == _TYPE_ID:
+            typename = values[pos]
+            pos += 1
+
+            field_quantifier = TOKEN_TO_FIELD_QUANTIFIER.get(kinds[pos])
+            if field_quantifier is not None:
+                pos += 1
+
+            if kinds[pos] in id_kinds:
+                id_ = values[pos]
+                pos += 1
+            else:
+                id_ = None
 
             fields.append(Field(typename, id_, field_quantifier))
 
-            if self.at_kind(TokenKind.RPAREN):
+            if kinds[pos] == _RPAREN:
                 break
 
-            elif self.at_kind(TokenKind.COMMA):
-                self.advance()
+            elif kinds[pos] == _COMMA:
+                pos += 1
 
-        self.match(TokenKind.RPAREN)
+        self._pos = pos
+        self.match(_RPAREN)
         return fields
 
-    def parse_optional_fields(self) -> list[Field]:
-        if self.at_kind(TokenKind.LPAREN):
-            return self.parse_fields()
-        else:
-            return []
-
     def parse_optional_attributes(self) -> list[Field]:
         if self.at_keyword("attributes"):
             self.advance()
@@ -534,19 +878,13 @@ class ASDLParser:
         else:
             return []
 
-    def parse_optional_field_quantifier(self) -> Optional[FieldQuantifier]:
-        quantifier = TOKEN_TO_FIELD_QUANTIFIER.get(self.cur_token.kind)
-        if quantifier is not None:
-            self.advance()
-        return quantifier
-
     # endregion
 
 
 def parse(source: str) -> Module:
     """Parse ASDL from the given buffer and return a Module node describing it."""
 
-    return ASDLParser().parse(tokenize(source))
+    return ASDLParser().parse_packed(*tokenize_packed(source))
 
 
 # endregion
@@ -559,9 +897,6 @@ def parse(source: str) -> Module:
 # outputs Python code.
 # ============================================================================
 
-
-_ASTGen: TypeAlias = Generator[AST, Any, Any]
-
 ASDL_TYPE_TO_PYTHON_TYPE = {
     "identifier": "str",
     "string": "str",
@@ -572,40 +907,60 @@ ASDL_TYPE_TO_PYTHON_TYPE = {
 ASDL_TYPES = set(ASDL_TYPE_TO_PYTHON_TYPE)
 
 
-class Checker(NodeVisitor):
-    """A visitor that checks a parsed ASDL tree for correctness. Errors are accumulated."""
+class Checker:
+    """A checker for a parsed ASDL tree's correctness. Errors are accumulated.
+
+    The tree is always Module -> Type -> Sum/Product -> Constructor -> Field, so it's walked directly in one pass
+    instead of going through a visitor.
+    """
 
     constructors: dict[str, str]
-    types: dict[str, list[str]]
+    types: defaultdict[str, list[str]]
     error_messages: list[str]
 
     def __init__(self):
-        super().__init__()
         self.constructors = {}
-        self.types = {}
+        self.types = defaultdict(list)
         self.error_messages = []
-        self._parent_type_name: str = ""
 
-    def visit_Type(self, node: Type) -> _ASTGen:
-        self._parent_type_name = node.name
-        return self.generic_visit(node)
+    def check(self, mod: Module) -> None:
+        """Record every constructor and field type use in a module, noting any constructor redefinitions and
+        undefined types.
+        """
 
-    def visit_Constructor(self, node: Constructor) -> _ASTGen:
-        parent_name = self._parent_type_name
-        self._parent_type_name = node.name
+        constructors = self.constructors
+        types = self.types
+        error_messages = self.error_messages
 
-        try:
-            conflict = self.constructors[self._parent_type_name]
-        except KeyError:
-            self.constructors[self._parent_type_name] = parent_name
-        else:
-            self.error_messages.append(f"Redefinition of constructor {self._parent_type_name}")
-            self.error_messages.append(f"Defined in {conflict} and {parent_name}")
+        for type_ in mod.dfns:
+            type_name = type_.name
+            value = type_.value
 
-        return self.generic_visit(node)
+            if isinstance(value, Sum):
+                for constructor in value.types:
+                    constructor_name = constructor.name
 
-    def visit_Field(self, field: Field) -> None:
-        self.types.setdefault(field.type, []).append(self._parent_type_name)
+                    if constructor_name in constructors:
+                        error_messages.append(f"Redefinition of constructor {constructor_name}")
+                        error_messages.append(f"Defined in {constructors[constructor_name]} and {type_name}")
+                    else:
+                        constructors[constructor_name] = type_name
+
+                    for field in constructor.fields:
+                        types[field.type].append(constructor_name)
+            else:
+                for field in value.fields:
+                    types[field.type].append(type_name)
+
+            for field in value.attributes:
+                types[field.type].append(type_name)
+
+        # Types can be used before they're defined, so this can only be checked after the pass.
+        expected_types = ASDL_TYPES.union([type_.name for type_ in mod.dfns])
+
+        for used_type_name, uses in types.items():
+            if used_type_name not in expected_types:
+                error_messages.append(f"Undefined type {used_type_name}, used in {', '.join(uses)}")
 
 
 def check_tree(mod: Module) -> None:
@@ -618,20 +973,10 @@ def check_tree(mod: Module) -> None:
     """
 
     checker = Checker()
-    checker.visit(mod)
+    checker.check(mod)
 
-    error_messages = checker.error_messages
-
-    module_types = {type_.name for type_ in mod.dfns}
-    expected_types = ASDL_TYPES | module_types
-
-    for type_name in checker.types:
-        if type_name not in expected_types:
-            uses = ", ".join(checker.types[type_name])
-            error_messages.append(f"Undefined type {type_name}, used in {uses}")
-
-    if error_messages:
-        raise ASDLSyntaxError("\n".join(error_messages))
+    if checker.error_messages:
+        raise ASDLSyntaxError("\n".join(checker.error_messages))
 
 
 class _AttributeStatements:
@@ -642,13 +987,95 @@ class _AttributeStatements:
         self.init_body_stmts = body_stmts
 
 
-class PythonCodeGenerator(NodeVisitor):
-    """Visitor that generates Python code based on the given AST into an internal string buffer."""
+# Templates for the generated class definitions. Each class is formatted in one go and written as a single part.
+_CLASS_TEMPLATE = """\
+class {name}({base}):
+{class_attrs}
+
+{init}
+"""
+
+_INIT_TEMPLATE = """\
+    def __init__({params}) -> None:
+{body}
+
+"""
+
+# The number of distinct field shapes and class definitions to remember across generate_code() calls, so that
+# regenerating the same or overlapping grammars in one process reuses earlier work.
+_CODEGEN_PART_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_CODEGEN_PART_CACHE_SIZE)
+def _build_init_param(field_type: str, field_name: Optional[str], quantifier: Optional[FieldQuantifier]) -> str:
+    """Build an annotated __init__ parameter for a field.
+
+    Grammars tend to repeat the same field shapes (e.g. ``identifier name`` or ``expr* elts``), so results are cached.
+    """
+
+    param_annotation = ASDL_TYPE_TO_PYTHON_TYPE.get(field_type, field_type)
+
+    if quantifier is FieldQuantifier.SEQ:
+        param_annotation = f"list[{param_annotation}]"
+
+    elif quantifier is FieldQuantifier.OPT:
+        param_annotation = f"Optional[{param_annotation}]"
+
+    return f"{field_name}: {param_annotation}"
+
+
+def _format_tuple(items: tuple[str, ...]) -> str:
+    """Format already-repr'd items as a tuple literal."""
+
+    if len(items) == 1:
+        return f"({items[0]},)"
+    else:
+        return f"({', '.join(items)})"
+
+
+class _ClassParts(NamedTuple):
+    """The pieces of a generated class definition. Hashable, so rendered classes can be cached by them."""
+
+    name: str
+    base: str
+    slots: tuple[str, ...]
+    match_fields: tuple[str, ...]
+    init_params: tuple[str, ...]
+    init_body: tuple[str, ...]
+
+
+@lru_cache(maxsize=_CODEGEN_PART_CACHE_SIZE)
+def _render_class(parts: _ClassParts) -> str:
+    """Render a full class definition from its pieces, caching the result."""
 
-    # NOTE: The calls to self.write might incur unnecessary overhead, but no benchmarking has been done yet.
+    init_params = parts.init_params
+    init_body = parts.init_body
+
+    # Only construct an __init__ if it's going to do something.
+    if len(init_params) > 1 or init_body:
+        body = "\n".join(f"        {body_stmt}" for body_stmt in init_body)
+        init = _INIT_TEMPLATE.format(params=", ".join(init_params), body=body)
+    else:
+        init = ""
+
+    # The match args and fields are the same tuple, and usually so are the slots, so share one object between them.
+    # Empty match args and fields are inherited from the base AST class instead.
+    fields = _format_tuple(parts.match_fields)
+    if not parts.match_fields:
+        class_attrs = f"    __slots__ = {_format_tuple(parts.slots)}"
+    elif parts.slots == parts.match_fields:
+        class_attrs = f"    __slots__ = __match_args__ = _fields = {fields}"
+    else:
+        class_attrs = f"    __slots__ = {_format_tuple(parts.slots)}\n    __match_args__ = _fields = {fields}"
+
+    return _CLASS_TEMPLATE.format(name=parts.name, base=parts.base, class_attrs=class_attrs, init=init)
+
+
+class PythonCodeGenerator(NodeVisitor):
+    """Visitor that generates Python code based on the given AST into an internal list of string parts."""
 
     def __init__(self):
-        self.buffer = StringIO()
+        self._parts: list[str] = []
 
         self._parent_type_name: str = ""
         self._parent_type_attributes: _AttributeStatements | None = None
@@ -657,7 +1084,7 @@ class PythonCodeGenerator(NodeVisitor):
         return self
 
     def __exit__(self, *_exc_info: object):
-        self.buffer.close()
+        self._parts.clear()
 
     def write(self, s: str = "", /, *, end: str = "\n") -> None:
         """Write a string to the internal buffer.
@@ -670,7 +1097,8 @@ class PythonCodeGenerator(NodeVisitor):
             What should be added to the end of the given string. Defaults to a newline.
         """
 
-        self.buffer.write(f"{s}{end}")
+        self._parts.append(s)
+        self._parts.append(end)
 
     def writelines(self, *lines: str, end: str = "\n") -> None:
         """Write multiple strings to the internal buffer.
@@ -681,12 +1109,19 @@ class PythonCodeGenerator(NodeVisitor):
             What should be added to the end of each string. Defaults to a newline.
         """
 
-        self.buffer.writelines(f"{line}{end}" for line in lines)
+        if lines:
+            self._parts.append(end.join(lines))
+            self._parts.append(end)
 
     def get_value(self) -> str:
         """Get the generated code."""
 
-        return self.buffer.getvalue()
+        return "".join(self._parts)
+
+    def write_to(self, stream: TextIO) -> None:
+        """Write the generated code to a text stream without joining it into one string first."""
+
+        stream.writelines(self._parts)
 
     def visit(self, node: AST) -> Any:
         """Construct the import statements and base class before starting the regular tree traversal."""
@@ -695,7 +1130,11 @@ class PythonCodeGenerator(NodeVisitor):
         self.writelines(
             "from __future__ import annotations",
             "",
-            "from typing import Optional",
+            "from typing import TYPE_CHECKING, ClassVar, Optional",
+            "",
+            "",
+            "if TYPE_CHECKING:",
+            "    from typing_extensions import Self",
             "",
             "",
         )
@@ -703,162 +1142,205 @@ class PythonCodeGenerator(NodeVisitor):
         # Base class
         self.writelines(
             "class AST:",
-            "    __match_args__ = ()",
-            "    _fields = ()",
+            '    __slots__ = ("__weakref__",)',
+            "    __match_args__ = _fields = ()",
+            "",
+            "    def __repr__(self) -> str:",
+            "        # One implementation for every node, driven by the class's fields.",
+            '        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)',
+            '        return f"{type(self).__name__}({fields})"',
+            "",
+            "",
+        )
+
+        # Shared base for classes without any state, e.g. operators
+        self.writelines(
+            "class _Singleton(AST):",
+            "    __slots__ = ()",
+            "",
+            "    _instance: ClassVar[Optional[_Singleton]]",
+            "",
+            "    def __new__(cls) -> Self:",
+            "        # Instances have no state, so they can all be the same object. Look the instance up in the class's",
+            "        # own namespace so that subclasses don't share their parent's instance.",
+            '        instance = cls.__dict__.get("_instance")',
+            "        if instance is None:",
+            "            instance = cls._instance = super().__new__(cls)",
+            "        return instance",
             "",
             "",
         )
 
         return super().visit(node)
 
-    def visit_Type(self, node: Type) -> _ASTGen:
+    def visit_Type(self, node: Type) -> None:
         self._parent_type_name = node.name
-        return self.generic_visit(node)
+
+        if isinstance(node.value, Sum):
+            self.visit_Sum(node.value)
+        else:
+            self.visit_Product(node.value)
 
     @staticmethod
-    def _build_init_param_from_field(field: Field) -> str:
-        param_name = f"{field.name}: "
-        param_annotation = ASDL_TYPE_TO_PYTHON_TYPE.get(field.type, field.type)
+    def _fields_to_lines(fields: list[Field]) -> tuple[list[str], list[str], list[str]]:
+        """Build the match args, __init__ parameters, and __init__ body statements for the given fields."""
 
-        if field.quantifier is FieldQuantifier.SEQ:
-            param_annotation = f"list[{param_annotation}]"
+        match_fields = [repr(field.name) for field in fields]
+        init_params = [_build_init_param(field.type, field.name, field.quantifier) for field in fields]
+        init_body = [f"self.{field.name} = {field.name}" for field in fields]
+        return match_fields, init_params, init_body
 
-        elif field.quantifier is FieldQuantifier.OPT:
-            param_annotation = f"Optional[{param_annotation}]"
+    def _collect_attributes(self, attributes: list[Field]) -> _AttributeStatements | None:
+        if not attributes:
+            return None
 
-        return "".join((param_name, param_annotation))
+        _, attribute_init_params, attribute_init_body = self._fields_to_lines(attributes)
+        return _AttributeStatements(["*", *attribute_init_params], attribute_init_body)
 
-    def visit_Sum(self, node: Sum) -> _ASTGen:
-        init_params = ["self"]
-        init_body: list[str] = []
+    def _emit_class(self, parts: _ClassParts) -> None:
+        self.write(_render_class(parts), end="")
 
-        if node.attributes:
-            attribute_init_params = ["*"]
-            attribute_init_body: list[str] = []
+    def _emit_type_class(self, fields: list[Field], attributes: list[Field], *, abstract: bool = False) -> None:
+        """Emit the class for the current type, and stash its attributes for any constructors.
 
-            for attr in node.attributes:
-                attribute_init_params.append(self._build_init_param_from_field(attr))
-                attribute_init_body.append(f"self.{attr.name} = {attr.name}")
+        Abstract classes, i.e. the bases of sum types, don't get an __init__, since every constructor sets the attributes
+        itself.
+        """
 
-            init_params.extend(attribute_init_params)
-            init_body.extend(attribute_init_body)
+        match_fields, field_init_params, init_body = self._fields_to_lines(fields)
+        init_params = ["self", *field_init_params]
 
-            saved_attributes = _AttributeStatements(attribute_init_params, attribute_init_body)
-        else:
-            saved_attributes = None
+        saved_attributes = self._collect_attributes(attributes)
+        if saved_attributes and not abstract:
+            init_params.extend(saved_attributes.init_params)
+            init_body.extend(saved_attributes.init_body_stmts)
 
-        # Construct the sum class.
-        self.writelines(
-            f"class {self._parent_type_name}(AST):",
-            "    __match_args__ = ()",
-            "    _fields = ()",
-            "",
+        # Attributes get their slots here, so constructors only need slots for their own fields.
+        slots = (*match_fields, *(repr(attr.name) for attr in attributes))
+
+        parts = _ClassParts(
+            self._parent_type_name,
+            "AST",
+            slots,
+            tuple(match_fields),
+            tuple(init_params),
+            tuple(init_body),
         )
+        self._emit_class(parts)
+        self._parent_type_attributes = saved_attributes
 
-        # Only construct an __init__ if it's going to do something.
-        if len(init_params) > 1 or init_body:
-            self.write(f'    def __init__({", ".join(init_params)}) -> None:')
-            for body_stmt in init_body:
-                self.write(f"        {body_stmt}")
-            self.write()
+    def visit_Sum(self, node: Sum) -> None:
+        # Construct the sum class, then its constructors.
+        self._emit_type_class([], node.attributes, abstract=True)
 
-        self.write()
+        for constructor in node.types:
+            self.visit_Constructor(constructor)
 
-        self._parent_type_attributes = saved_attributes
-        return self.generic_visit(node)
+    def visit_Product(self, node: Product) -> None:
+        # Construct the product class.
+        self._emit_type_class(node.fields, node.attributes)
 
-    def visit_Product(self, node: Product) -> _ASTGen:
-        match_args_and_field_names: list[str] = []
-        init_params = ["self"]
-        init_body: list[str] = []
+    def visit_Constructor(self, node: Constructor) -> None:
+        match_fields, field_init_params, init_body = self._fields_to_lines(node.fields)
+        init_params = ["self", *field_init_params]
 
-        if node.fields:
-            for field in node.fields:
-                match_args_and_field_names.append(repr(field.name))
-                init_params.append(self._build_init_param_from_field(field))
-                init_body.append(f"self.{field.name} = {field.name}")
+        if self._parent_type_attributes:
+            init_params.extend(self._parent_type_attributes.init_params)
+            init_body.extend(self._parent_type_attributes.init_body_stmts)
 
-        if node.attributes:
-            attribute_init_params = ["*"]
-            attribute_init_body: list[str] = []
+        # Construct the concrete class. Classes without any state, e.g. operators, share a single instance.
+        if node.fields or self._parent_type_attributes:
+            base = self._parent_type_name
+        else:
+            base = f"{self._parent_type_name}, _Singleton"
+
+        field_names = tuple(match_fields)
+        parts = _ClassParts(
+            node.name,
+            base,
+            field_names,
+            field_names,
+            tuple(init_params),
+            tuple(init_body),
+        )
+        self._emit_class(parts)
 
-            for attr in node.attributes:
-                attribute_init_params.append(self._build_init_param_from_field(attr))
-                attribute_init_body.append(f"self.{attr.name} = {attr.name}")
 
-            init_params.extend(attribute_init_params)
-            init_body.extend(attribute_init_body)
+# The number of generated modules to remember.
+_GENERATE_CODE_CACHE_SIZE = 64
 
-            saved_attributes = _AttributeStatements(attribute_init_params, attribute_init_body)
-        else:
-            saved_attributes = None
 
-        match_args_and_fields = ", ".join(match_args_and_field_names)
+@lru_cache(maxsize=_GENERATE_CODE_CACHE_SIZE)
+def _generate_code_cached(source: str, *, validate: bool) -> str:
+    """Generate Python code based on the given ASDL description, caching the result by source."""
 
-        # Construct the product class.
-        self.writelines(
-            f"class {self._parent_type_name}(AST):",
-            f"    __match_args__ = ({match_args_and_fields})",
-            f"    _fields = ({match_args_and_fields})",
-            "",
-        )
+    tree = parse(source)
+    if validate:
+        check_tree(tree)
 
-        # Only construct an __init__ if it's going to do something.
-        if len(init_params) > 1 or init_body:
-            self.write(f'    def __init__({", ".join(init_params)}) -> None:')
-            for body_stmt in init_body:
-                self.write(f"        {body_stmt}")
-            self.write()
+    with PythonCodeGenerator() as code_generator:
+        code_generator.visit(tree)
+        return code_generator.get_value()
 
-        self.write()
 
-        self._parent_type_attributes = saved_attributes
-        return self.generic_visit(node)
+def generate_code(source: str, *, validate: bool = True) -> str:
+    """Generate Python code based on the given ASDL description.
 
-    def visit_Constructor(self, node: Constructor) -> None:
-        match_args_and_field_names: list[str] = []
-        init_params = ["self"]
-        init_body: list[str] = []
+    The results are cached by source, so repeated calls with the same description skip parsing and code generation.
+    Use ``clear_code_cache()`` to reset the cache.
 
-        if node.fields:
-            for field in node.fields:
-                match_args_and_field_names.append(repr(field.name))
-                init_params.append(self._build_init_param_from_field(field))
-                init_body.append(f"self.{field.name} = {field.name}")
+    Parameters
+    ----------
+    source: str
+        The ASDL description.
+    validate: bool, default=True
+        Whether to check the parsed description for errors, e.g. undefined types, before generating code. Can be
+        turned off for descriptions that are already known to be valid.
+    """
 
-        if self._parent_type_attributes:
-            init_params.extend(self._parent_type_attributes.init_params)
-            init_body.extend(self._parent_type_attributes.init_body_stmts)
+    return _generate_code_cached(source, validate=validate)
 
-        match_args_and_fields = ", ".join(match_args_and_field_names)
 
-        # Construct the concrete class.
-        self.writelines(
-            f"class {node.name}({self._parent_type_name}):",
-            f"    __match_args__ = ({match_args_and_fields})",
-            f"    _fields = ({match_args_and_fields})",
-            "",
-        )
+def clear_code_cache() -> None:
+    """Clear the cache of code generated by ``generate_code()``."""
 
-        # Only construct an __init__ if it's going to do something.
-        if len(init_params) > 1 or init_body:
-            self.write(f'    def __init__({", ".join(init_params)}) -> None:')
-            for body_stmt in init_body:
-                self.write(f"        {body_stmt}")
-            self.write()
+    _generate_code_cached.cache_clear()
 
-        self.write()
 
+def generate_code_to(stream: TextIO, source: str, *, validate: bool = True) -> None:
+    """Generate Python code based on the given ASDL description and write it to a text stream.
 
-def generate_code(source: str) -> str:
-    """Generate Python code based on the given ASDL description."""
+    Unlike ``generate_code()``, the result isn't cached, and the code is written out in pieces instead of being built
+    into a single string first. ``validate`` has the same meaning as for ``generate_code()``.
+    """
 
     tree = parse(source)
-    check_tree(tree)
+    if validate:
+        check_tree(tree)
 
     with PythonCodeGenerator() as code_generator:
         code_generator.visit(tree)
-        return code_generator.get_value()
+        code_generator.write_to(stream)
+
+
+def generate_module(source: str, name: str = "asdl_ast", *, validate: bool = True) -> ModuleType:
+    """Generate Python code based on the given ASDL description and execute it in a new module, without writing it to
+    a file first.
+
+    The module isn't added to ``sys.modules``. ``validate`` has the same meaning as for ``generate_code()``.
+
+    Parameters
+    ----------
+    source: str
+        The ASDL description.
+    name: str, default="asdl_ast"
+        The name of the new module.
+    """
+
+    code = compile(generate_code(source, validate=validate), f"<{name}>", "exec")
+    module = ModuleType(name)
+    exec(code, module.__dict__)  # noqa: S102 # The executed code is generated by this module.
+    return module
 
 
 # endregion